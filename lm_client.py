@@ -0,0 +1,13 @@
+import dspy
+from dotenv import load_dotenv
+import os
+
+_LM = None
+
+def get_lm():
+    global _LM
+    if _LM is None:
+        load_dotenv()
+        _LM = dspy.LM("openai/gpt-4o-search-preview-2025-03-11", api_key=os.getenv("OPENAI_API_KEY"), temperature=None)
+        dspy.configure(lm=_LM)
+    return _LM
@@ -2,45 +2,22 @@ import webbrowser
 import os
 import re
 
-def create_player_card(player_name, data):
-    def convert_links(text):
-        return re.sub(r'\[([^\]]+)\]\((https?://[^\)]+)\)', r'<a href="\2" target="_blank">\1</a>', text)
-
-    def get_color_class(metric_name, value):
-        if metric_name == "playing_time":
-            if value <= -3:
-                return "red"
-            elif value >= 3:
-                return "green"
-            else:
-                return "black"
-        elif metric_name == "injury_risk":
-            if value >= 3:
-                return "red"
-            else:
-                return "black"
-        elif metric_name == "breakout_risk":
-            if value >= 3:
-                return "green"
-            else:
-                return "black"
-        elif metric_name == "bust_risk":
-            if value >= 3:
-                return "red"
-            else:
-                return "black"
-        return "black"
+_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^\)]+)\)')
 
-    key_changes_html = convert_links(data.key_changes)
-    outlook_html = convert_links(data.outlook)
+_COLOR_TABLE = {
+    "playing_time": lambda v: "red" if v <= -3 else "green" if v >= 3 else "black",
+    "injury_risk": lambda v: "red" if v >= 3 else "black",
+    "breakout_risk": lambda v: "green" if v >= 3 else "black",
+    "bust_risk": lambda v: "red" if v >= 3 else "black",
+}
 
-    html_content = f"""
+_PLAYER_CARD_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
     <title>Fantasy Football Player Card</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             background-color: #f0f2f5;
             display: flex;
@@ -48,106 +25,146 @@ def create_player_card(player_name, data):
             align-items: center;
             height: 100vh;
             margin: 0;
-        }}
-        .card {{
+        }
+        .card {
             background-color: white;
             border-radius: 15px;
             box-shadow: 0 4px 8px rgba(0,0,0,0.1);
             padding: 20px;
             max-width: 600px;
             text-align: left;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             border-bottom: 1px solid #eee;
             padding-bottom: 10px;
             margin-bottom: 20px;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             color: #333;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 15px;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             font-size: 1.2em;
             color: #555;
             border-bottom: 2px solid #eee;
             padding-bottom: 5px;
-        }}
-        .section p {{
+        }
+        .section p {
             color: #666;
             line-height: 1.6;
-        }}
-        .metrics {{
+        }
+        .metrics {
             display: flex;
             justify-content: space-around;
             text-align: center;
             margin-bottom: 20px;
-        }}
-        .metric {{
+        }
+        .metric {
             flex: 1;
-        }}
-        .metric h3 {{
+        }
+        .metric h3 {
             margin: 0;
             color: #333;
-        }}
-        .metric p {{
+        }
+        .metric p {
             margin: 5px 0 0 0;
             font-size: 1.5em;
             font-weight: bold;
-        }}
-        .scale {{
+        }
+        .scale {
             font-size: 0.8em;
             color: #999;
-        }}
-        .red {{ color: red; }}
-        .green {{ color: green; }}
-        .black {{ color: black; }}
+        }
+        .red { color: red; }
+        .green { color: green; }
+        .black { color: black; }
     </style>
     </head>
     <body>
-    <div class="card">
+""".encode("utf-8")
+
+_PLAYER_CARD_BODY = """    <div class="card">
         <div class="header">
-            <h1>{player_name}</h1>
+            <h1>$player_name</h1>
         </div>
         <div class="metrics">
             <div class="metric">
                 <h3>Playing Time</h3>
-                <p class="{get_color_class('playing_time', data.playing_time)}">{data.playing_time}</p>
+                <p class="$playing_time_class">$playing_time</p>
                 <span class="scale">(-5 to 5)</span>
             </div>
             <div class="metric">
                 <h3>Injury Risk</h3>
-                <p class="{get_color_class('injury_risk', data.injury_risk)}">{data.injury_risk}</p>
+                <p class="$injury_risk_class">$injury_risk</p>
                 <span class="scale">(0 to 5)</span>
             </div>
             <div class="metric">
                 <h3>Breakout Risk</h3>
-                <p class="{get_color_class('breakout_risk', data.breakout_risk)}">{data.breakout_risk}</p>
+                <p class="$breakout_risk_class">$breakout_risk</p>
                 <span class="scale">(0 to 5)</span>
             </div>
             <div class="metric">
                 <h3>Bust Risk</h3>
-                <p class="{get_color_class('bust_risk', data.bust_risk)}">{data.bust_risk}</p>
+                <p class="$bust_risk_class">$bust_risk</p>
                 <span class="scale">(0 to 5)</span>
             </div>
         </div>
         <div class="section">
             <h2>Key Changes</h2>
-            <p>{key_changes_html}</p>
+            <p>$key_changes_html</p>
         </div>
         <div class="section">
             <h2>Outlook</h2>
-            <p>{outlook_html}</p>
+            <p>$outlook_html</p>
         </div>
     </div>
-    </body>
+"""
+
+_PLAYER_CARD_TAIL = """    </body>
     </html>
-    """
-    with open("player_card.html", "w") as f:
-        f.write(html_content)
+    """.encode("utf-8")
+
+# Static chunks of the card body are pre-encoded; odd entries are the names of the $fields between them.
+_PLAYER_CARD_PARTS = [
+    part.encode("utf-8") if i % 2 == 0 else part
+    for i, part in enumerate(re.split(r'\$(\w+)', _PLAYER_CARD_BODY))
+]
+
+def convert_links(text):
+    return _LINK_RE.sub(r'<a href="\2" target="_blank">\1</a>', text)
+
+def get_color_class(metric_name, value):
+    return _COLOR_TABLE.get(metric_name, lambda _: "black")(value)
+
+def create_player_card(player_name, data):
+    key_changes_html = convert_links(data.key_changes)
+    outlook_html = convert_links(data.outlook)
+
+    fields = {
+        "player_name": player_name,
+        "playing_time": data.playing_time,
+        "playing_time_class": get_color_class('playing_time', data.playing_time),
+        "injury_risk": data.injury_risk,
+        "injury_risk_class": get_color_class('injury_risk', data.injury_risk),
+        "breakout_risk": data.breakout_risk,
+        "breakout_risk_class": get_color_class('breakout_risk', data.breakout_risk),
+        "bust_risk": data.bust_risk,
+        "bust_risk_class": get_color_class('bust_risk', data.bust_risk),
+        "key_changes_html": key_changes_html,
+        "outlook_html": outlook_html,
+    }
+    card_bytes = b"".join(
+        part if i % 2 == 0 else str(fields[part]).encode("utf-8")
+        for i, part in enumerate(_PLAYER_CARD_PARTS)
+    )
+    with open("player_card.html", "wb", buffering=1 << 16) as f:
+        f.write(_PLAYER_CARD_HEAD)
+        f.write(card_bytes)
+        f.write(_PLAYER_CARD_TAIL)
 
     filepath = os.path.abspath("player_card.html")
     webbrowser.open_new_tab(f"file://{filepath}")
\ No newline at end of file